@@ -1,16 +1,144 @@
 import sys
 import os
-import re
 import datetime
+import functools
+import multiprocessing
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat, tee
+
+try:
+    from itertools import pairwise
+except ImportError:
+    # Python < 3.10: the documented pairwise recipe
+    def pairwise(iterable):
+        a, b = tee(iterable)
+        next(b, None)
+        return zip(a, b)
 
 from systemrdl.node import RootNode, Node, RegNode, AddrmapNode, RegfileNode
 from systemrdl.node import FieldNode, MemNode, AddressableNode
 from systemrdl.rdltypes import AccessType, OnReadType, OnWriteType
 from systemrdl import RDLWalker
 
-from .pdf_creator import PDFCreator
-from .pre_export_listener import PreExportListener
+from .pdf_creator import PDFCreator, RegRow, FieldRow
+from .pre_export_listener import AddrmapListener, PreExportListener
+
+# Sentinel for misses in the property cache
+_MISS = object()
+
+def _render_root_worker(args):
+    """
+    Renders a single root into its own output file.
+
+    Used by the parallel export path; runs in a worker process with a
+    fresh exporter/PDFCreator, since ReportLab document state cannot be
+    shared across processes. Must stay a picklable top-level function.
+    """
+    root, path, use_uppercase_inst_name, workers = args
+    exporter = PDFExporter()
+    # verbose is forced off: the parent process owns progress reporting
+    exporter.export([root], path,
+                    use_uppercase_inst_name=use_uppercase_inst_name,
+                    verbose=False,
+                    workers=workers)
+    return path
+
+# Translation table for scrubbing description text, applied in a single
+# C-level pass instead of chained str.replace calls
+_DESC_TRANS = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+# Cache of hex format strings
+# key = (width in bits, is_address)
+# value = '{:0N_X}' format string with N sized for the width plus the
+# underscore separators
+_HEX_FMT_CACHE = {}
+
+def _hex_fmt(width_bits: int, is_address: bool=False) -> str:
+    """
+    Returns the zero-padded underscore-grouped hex format string for the
+    given width, building it only once per width
+    """
+    key = (width_bits, is_address)
+    fmt = _HEX_FMT_CACHE.get(key)
+    if fmt is None:
+        no_of_nib = width_bits >> 2
+
+        # 64bit data
+        if no_of_nib == 16:
+            format_number = no_of_nib + 3
+        # 32bit data
+        elif no_of_nib == 8:
+            format_number = no_of_nib + 1
+        # 16bit or 8bit data
+        else:
+            # Addresses are always padded by one extra digit
+            format_number = no_of_nib + 1 if is_address else no_of_nib
+
+        fmt = '{:0' + str(format_number) + '_X}'
+        _HEX_FMT_CACHE[key] = fmt
+    return fmt
+
+@functools.lru_cache(maxsize=None)
+def _array_offset_expr(raw_address_offset: int, dims: tuple, stride: int) -> str:
+    """
+    Builds the array address offset expression, memoized since many
+    array nodes share the same offset/dimensions/stride
+    """
+    # Per-dimension multipliers via one right-to-left cumulative
+    # product, instead of re-multiplying the dimension suffix for
+    # every index
+    mults = [0] * len(dims)
+    acc = stride
+    for i in range(len(dims)-1, -1, -1):
+        mults[i] = acc
+        acc *= dims[i]
+
+    s = "'h%x" % raw_address_offset
+    for i, m in enumerate(mults):
+        s += " + i%d*'h%x" % (i, m)
+    return s
+
+# Dispatch tables for get_field_access(), built once at import time so
+# each field costs a couple of dict lookups instead of a long if/elif
+# cascade.
+# Combined (sw, onread, onwrite) access strings
+_FIELD_ACCESS_MAP = {
+    (AccessType.rw, None,            None):             "RW",
+    (AccessType.rw, OnReadType.rclr, OnWriteType.woset): "W1SRC",
+    (AccessType.rw, OnReadType.rclr, OnWriteType.wzs):   "W0SRC",
+    (AccessType.rw, OnReadType.rclr, OnWriteType.wset):  "WSRC",
+    (AccessType.rw, OnReadType.rset, OnWriteType.woclr): "W1CRS",
+    (AccessType.rw, OnReadType.rset, OnWriteType.wzc):   "W0CRS",
+    (AccessType.rw, OnReadType.rset, OnWriteType.wclr):  "WCRS",
+}
+
+# Fallbacks for sw=rw when only one side effect matches
+_FIELD_ACCESS_RW_ONWRITE = {
+    OnWriteType.woclr: "RW1C",
+    OnWriteType.woset: "RW1S",
+    OnWriteType.wot:   "RW1T",
+    OnWriteType.wzc:   "RW0C",
+    OnWriteType.wzs:   "RW0S",
+    OnWriteType.wzt:   "RW0T",
+    OnWriteType.wclr:  "RWC",
+    OnWriteType.wset:  "RWS",
+}
+
+_FIELD_ACCESS_RW_ONREAD = {
+    OnReadType.rclr: "WRC",
+    OnReadType.rset: "WRS",
+}
+
+_FIELD_ACCESS_R_ONREAD = {
+    OnReadType.rclr: "RC",
+    OnReadType.rset: "RS",
+}
+
+_FIELD_ACCESS_W_ONWRITE = {
+    OnWriteType.wclr: "WOC",
+    OnWriteType.wset: "WOS",
+}
 
 class PDFExporter:
     
@@ -43,29 +171,115 @@ class PDFExporter:
         # Used for making the instance name(s) in uppercase or lowercase
         self.use_uppercase_inst_name = True
 
+        # Controls the per-root progress printout
+        self.verbose = True
+
+        # Number of threads used to build the per-register detail
+        # blocks; 1 = build them inline
+        self.workers = 1
+
         # Used for address width - Default 32bits
-        self.address_width = 32 
+        self.address_width = 32
+        self._bind_address_format()
 
         # Used for absoulte address calculations
         self.base_address = 0x0
 
-        # Get the today's date (mm-dd-yyyy)
-        self.today_date = datetime.date.today().strftime('%m-%d-%Y')
-
-        # Get the current time (hh:mm:ss)
-        self.current_time = time.strftime('%H:%M:%S') 
+        # Addrmap currently being exported. While set, the addrmap-level
+        # accessors below return the _amap_* values cached by
+        # set_current_addrmap() instead of re-walking the parent chain
+        # and re-querying the same UDPs per register/field
+        self._current_amap = None
+
+        # Cache of composed register reset values for get_reg_reset()
+        # key = id(node)
+        # value = (node, reset value)
+        self._reg_reset_cache = {}
+
+        # Cache of per-node UDP name sets for check_udp()
+        # key = id(node)
+        # value = (node, frozenset of UDP names)
+        self._udp_cache = {}
+
+        # Cache of node property lookups
+        # key = (id(node), property name)
+        # value = (node, property value)
+        # The node is kept in the value so its id() stays unique for the
+        # lifetime of the cache entry
+        self._prop_cache = {}
+
+        # Cache of cased instance names for get_inst_name()
+        # key = id(node)
+        # value = (node, cased name)
+        self._name_cache = {}
+
+        # Today's date and current time are captured lazily by the
+        # properties below, so constructing an exporter costs no
+        # strftime/syscall work
+        self._today_date = None
+        self._current_time = None
 
         # Create the global variable for pdf creation
         global pdf_create
 
+    @property
+    def today_date(self) -> str:
+        """
+        The today's date (mm-dd-yyyy), captured on first access
+        """
+        if self._today_date is None:
+            self._today_date = datetime.date.today().strftime('%m-%d-%Y')
+        return self._today_date
+
+    @property
+    def current_time(self) -> str:
+        """
+        The current time (hh:mm:ss), captured on first access
+        """
+        if self._current_time is None:
+            self._current_time = time.strftime('%H:%M:%S')
+        return self._current_time
+
     def set_address_width(self, node: Node):
         self.address_width = self.get_address_width(node)
+        self._bind_address_format()
+
+    def _bind_address_format(self):
+        # Hoist the formatting invariants that only depend on the
+        # address width, so format_address does no per-call setup
+        self._addr_fmt = _hex_fmt(self.address_width, is_address=True).format
+        self._addr_bits_str = str(self.address_width)
 
     def set_base_address(self, node:Node):
         # Get the property value
         amap = node.owning_addrmap
+        if amap is self._current_amap:
+            self.base_address = self._amap_base_address
+            return
         self.base_address = amap.get_property("base_address_p", default=0x0);
 
+    def set_current_addrmap(self, node: AddrmapNode):
+        """
+        Cache the properties of the addrmap being exported, so the
+        addrmap-level accessors become O(1) for every register/field
+        emitted under it
+        """
+
+        # Invalidate while recomputing so the accessors below take
+        # their full lookup paths
+        self._current_amap = None
+
+        self.set_address_width(node)
+        self.set_base_address(node)
+
+        self._amap_address_width = self.address_width
+        self._amap_base_address = self.base_address
+        self._amap_base_address_str = self.get_base_address(node)
+        self._amap_map_name = self.get_inst_map_name(node)
+        self._amap_endian = self.get_endianness(node)
+
+        self._current_amap = node
+
     def export(self, node_list: list, path: str, **kwargs):
         """
         Perform the export!
@@ -83,16 +297,52 @@ class PDFExporter:
             If True (Default), all the instance names will be in uppercase
 
             if False, all the instance names will be in lowercase
+
+        parallel: bool
+            If True, render the roots concurrently on all cores, one
+            output file per root (the root number is appended to the
+            file name)
+
+            If False (Default), render everything sequentially into a
+            single output file
+
+        verbose: bool
+            If True (Default), print a progress percentage per root.
+
+            If False, suppress the progress output (useful when the
+            exporter is driven as a library)
+
+        workers: int
+            Number of threads used to build the per-register detail
+            blocks of each address map (Default 1 = build them inline).
+            Gains are bounded by the GIL, since the work is pure Python
         """
 
         self.use_uppercase_inst_name = kwargs.pop("use_uppercase_inst_name", True)
+        parallel = kwargs.pop("parallel", False)
+        self.verbose = kwargs.pop("verbose", True)
+        self.workers = kwargs.pop("workers", 1)
+
+        # Bind the matching specialization once for this run
+        self.get_inst_name = (self._inst_name_upper
+                              if self.use_uppercase_inst_name
+                              else self._inst_name_lower)
+
+        # Keep the per-node caches bounded per run
+        self._prop_cache.clear()
+        self._reg_reset_cache.clear()
+        self._udp_cache.clear()
+        self._name_cache.clear()
 
         # Check for stray kwargs
         if kwargs:
             raise TypeError("got an unexpected keyword argument '%s'" % list(kwargs.keys())[0])
 
         # Call the method for initiating the document creation
-        self.generate_output_pdf(node_list, path)
+        if parallel and len(node_list) > 1:
+            self.generate_output_pdfs_parallel(node_list, path)
+        else:
+            self.generate_output_pdf(node_list, path)
 
     #####################################################################
     # Generate the output pdf files
@@ -102,134 +352,211 @@ class PDFExporter:
         # Create the object
         self.pdf_create = PDFCreator(path)
 
-        # Go through multiple input files 
+        # Go through multiple input files
         # root_list is elaborated output of input .rdl file(s)
         for root_id, root in enumerate(root_list):
-            for node in root.descendants(in_post_order=True):
-
-                # Traverse all the address maps
-                if isinstance(node, AddrmapNode):
-                    self.create_regmap_list(node, root_id)
-                    self.create_regmap_registers_info(node, root_id)
+            # Collect the address maps in post order without yielding
+            # every register/field descendant along the way; the same
+            # walk also fills bus_width_db for get_bus_width()
+            listener = AddrmapListener(self)
+            RDLWalker(unroll=False).walk(root, listener)
+
+            # Traverse all the address maps
+            for node in listener.addrmaps:
+                # Cache the addrmap-level properties for this map
+                self.set_current_addrmap(node)
+
+                # Collect the registers once and share the list between
+                # both passes to avoid re-walking the child nodes
+                regs = list(node.registers())
+                self.create_regmap_info(node, root_id, regs)
 
             # Dump all the data into the pdf file 
             self.pdf_create.build_document()
-            print("[%d%%]" % (float(root_id+1)*100/len(root_list)))
+            if self.verbose:
+                print("[%d%%]" % ((root_id+1)*100//len(root_list)))
 
     #####################################################################
-    # Create the regmap list for all regiters
+    # Generate one output pdf file per root, in parallel
     #####################################################################
-    def create_regmap_list(self, node: AddrmapNode, root_id: int): 
+    def generate_output_pdfs_parallel(self, root_list: list, path: str):
+
+        # Each root becomes an independent document, so dispatch them to
+        # a process pool. The per-root work (tree walking + ReportLab
+        # layout) is compute bound, so this scales up to the core count
+        base, ext = os.path.splitext(path)
+        jobs = []
+        for root_id, root in enumerate(root_list):
+            root_path = "%s_%d%s" % (base, root_id+1, ext)
+            jobs.append((root, root_path, self.use_uppercase_inst_name, self.workers))
+
+        with multiprocessing.Pool(min(len(jobs), os.cpu_count() or 1)) as pool:
+            for done, _ in enumerate(pool.imap_unordered(_render_root_worker, jobs)):
+                if self.verbose:
+                    print("[%d%%]" % ((done+1)*100//len(jobs)))
+
+    #####################################################################
+    # Create the regmap list and the registers info for a map
+    #####################################################################
+    def create_regmap_info(self, node: AddrmapNode, root_id: int, regs: list=None):
+        # Callers that already materialized the register list share it
+        # here; otherwise walk the node once ourselves
+        if regs is None:
+            regs = list(node.registers())
+
         addrmap_strg = {}
-        # set the required variable 
+        # set the required variable
         self.set_address_width(node)
         self.set_base_address(node)
 
-        addrmap_strg['Name'] = "%s %s" % ((root_id+1),self.get_name(node))
+        # Hoisted once; reused by every row id below
+        root_num = root_id + 1
+
+        addrmap_strg['Name'] = f"{root_num} {self.get_name(node)}"
         addrmap_strg['Desc'] = self.get_desc(node)
         addrmap_strg['Base_address'] = self.get_base_address(node)
         addrmap_strg['Size'] = self.get_addrmap_size(node)
         self.pdf_create.create_addrmap_info(addrmap_strg)
 
-        # Create a list of all registers for the map
-        for reg_id, reg in enumerate(node.registers()):
-            addrmap_reg_list_strg = {}
-            
+        # Hoist the register offsets and sizes into parallel lists
+        # (structure-of-arrays) so the gap arithmetic below runs on
+        # plain ints instead of re-dispatching the node accessors
+        offsets = [reg.address_offset for reg in regs]
+        sizes = [reg.total_size for reg in regs]
+
+        # A fully packed map - first register at offset 0 and the total
+        # span equal to the summed register sizes - cannot contain any
+        # reserved holes, so the scan below is skipped outright.
+        # Registers never overlap, so the span test is sufficient
+        packed = bool(regs) and offsets[0] == 0 and (offsets[-1] + sizes[-1]) == sum(sizes)
+
+        # Pre-compute the reserved row (if any) that precedes each
+        # register, pairwise over neighbours so the main loop carries no
+        # sentinel state
+        gap_rows = [None] * len(regs)
+
+        if not packed:
             # Reserved addresses at the start of the address map
-            if reg_id == 0 and reg.address_offset != 0:
-                offset_range = "%s till %s" % ((self.format_address(0)),self.format_address(reg.address_offset-1))
-                addrmap_reg_list_strg['Offset']     = offset_range 
-                addrmap_reg_list_strg['Identifier'] = "-" 
-                addrmap_reg_list_strg['Name']       = "-"
-                self.pdf_create.create_reg_list_info(addrmap_reg_list_strg, 1)
-
-            # Reserved addresses in between the address map - for single space
-            elif (reg_id != 0) and (reg_previous.address_offset + 2*reg_previous.total_size) == reg.address_offset:
-                addrmap_reg_list_strg['Offset']     = self.format_address(reg_previous.address_offset + reg_previous.total_size)
-                addrmap_reg_list_strg['Identifier'] = "-" 
-                addrmap_reg_list_strg['Name']       = "-"
-                self.pdf_create.create_reg_list_info(addrmap_reg_list_strg, 1)
-
-            # Reserved addresses in between the address map - for a range fo free spaces
-            elif (reg_id != 0) and (reg_previous.address_offset + reg_previous.total_size) < reg.address_offset:
-                start_addr = reg_previous.address_offset + reg_previous.total_size
-
-                index = 0
-                while((reg_previous.address_offset + reg_previous.total_size + index) < reg.address_offset):
-                    index = index + reg.total_size
-                    
-                end_addr = reg_previous.address_offset + reg_previous.total_size + index
-
-                offset_range = "%s till %s" % ((self.format_address(start_addr)),self.format_address(end_addr-1))
-                addrmap_reg_list_strg['Offset']     = offset_range 
-                addrmap_reg_list_strg['Identifier'] = "-" 
-                addrmap_reg_list_strg['Name']       = "-"
-                self.pdf_create.create_reg_list_info(addrmap_reg_list_strg, 1)
+            if regs and offsets[0] != 0:
+                offset_range = f"{self.format_address(0)} till {self.format_address(offsets[0]-1)}"
+                gap_rows[0] = RegRow(offset_range, "-", None, "-")
+
+            for reg_id, ((prev_offset, prev_size), (reg_offset, _)) in enumerate(pairwise(zip(offsets, sizes)), start=1):
+                prev_end = prev_offset + prev_size
+
+                # Reserved addresses in between the address map - for single space
+                if (prev_end + prev_size) == reg_offset:
+                    gap_rows[reg_id] = RegRow(self.format_address(prev_end), "-", None, "-")
+
+                # Reserved addresses in between the address map - for a range fo free spaces
+                elif prev_end < reg_offset:
+                    offset_range = f"{self.format_address(prev_end)} till {self.format_address(reg_offset-1)}"
+                    gap_rows[reg_id] = RegRow(offset_range, "-", None, "-")
+
+        # Walk the registers exactly once, accumulating both the
+        # register-list rows and the per-register detail blocks.
+        # List rows are RegRow records; a None in the reg_id slot marks
+        # a reserved row
+        reg_rows = []
+        for reg_id, reg in enumerate(regs):
+            reg_offset = offsets[reg_id]
+
+            # Reserved addresses preceding this register
+            if gap_rows[reg_id] is not None:
+                reg_rows.append(gap_rows[reg_id])
 
             # Normal registers in the address map
-            addrmap_reg_list_strg['Offset']     = self.format_address(reg.address_offset) 
-            addrmap_reg_list_strg['Identifier'] = self.get_inst_name(reg)
-            addrmap_reg_list_strg['Id']         = "%s.%s" % ((root_id+1),(reg_id+1))
-            addrmap_reg_list_strg['Name']       = self.get_inst_name(reg)
-            self.pdf_create.create_reg_list_info(addrmap_reg_list_strg, 0)
-
-            # Store previous item
-            reg_previous = reg
+            reg_rows.append(RegRow(self.format_address(reg_offset),
+                                   self.get_inst_name(reg),
+                                   f"{root_num}.{reg_id+1}",
+                                   self.get_inst_name(reg)))
+
+        # Detail section for the separate register(s) pages; the blocks
+        # are independent per register, so with workers > 1 they are
+        # built on a thread pool (map keeps the document order)
+        if self.workers > 1 and len(regs) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(regs))) as pool:
+                detail_blocks = list(pool.map(self._build_register_block,
+                                              regs, range(len(regs)), repeat(root_num)))
+        else:
+            detail_blocks = [self._build_register_block(reg, reg_id, root_num)
+                             for reg_id, reg in enumerate(regs)]
 
+        # Emit the register list table, then the detail sections, in the
+        # same document order as before
+        self.pdf_create.create_reg_list_info_bulk(reg_rows)
         self.pdf_create.dump_reg_list_info()
 
-    #####################################################################
-    # Create the regiters info
-    #####################################################################
-    def create_regmap_registers_info(self, node: AddrmapNode, root_id: int): 
-        # Traverse all the registers for separate register(s) section
-        for reg_id, reg in enumerate(node.registers()):
-            registers_strg = {}
-            registers_strg['Name'] = "%s.%s %s" % ((root_id+1),(reg_id+1),self.get_inst_name(reg))
-            registers_strg['Desc1'] = self.get_name(reg)
-            registers_strg['Desc2'] = self.get_desc(reg)
-            registers_strg['Absolute_address'] = self.get_reg_absolute_address(reg)
-            registers_strg['Base_offset'] = self.get_reg_offset(reg)
-            registers_strg['Reset'] = self.get_reg_reset(reg)
-            registers_strg['Access'] = self.get_reg_access(reg)
-            registers_strg['Size'] = self.get_reg_size(reg)
-
+        for registers_strg, field_rows in detail_blocks:
             self.pdf_create.create_register_info(registers_strg)
-
-            # Reverse the fields order - MSB first
-            fields_list = []
-            for field in reg.fields():
-                if isinstance(field, FieldNode):
-                    fields_list.append(field)
-
-            fields_list.reverse()
-
-            # Traverse all the fields
-            for field in fields_list:
-                fields_list_strg = {}
-                fields_list_strg['Bits']        = self.get_field_bits(field)
-                fields_list_strg['Identifier']  = self.get_inst_name(field)
-                fields_list_strg['Access']      = self.get_field_access(field)
-                fields_list_strg['Reset']       = self.get_field_reset(field)
-                fields_list_strg['Name']        = self.get_name(field)
-                fields_list_strg['Description'] = self.get_desc(field)
-
-                self.pdf_create.create_fields_list_info(fields_list_strg)
-
+            self.pdf_create.create_fields_list_info_bulk(field_rows)
             self.pdf_create.dump_field_list_info()
 
+    def _build_register_block(self, reg: RegNode, reg_id: int, root_num: int):
+        """
+        Builds one register's detail block: the header dict plus its
+        FieldRow list. Touches only this register's nodes and the
+        per-node caches, so blocks for different registers can be built
+        concurrently
+        """
+        registers_strg = {}
+        registers_strg['Name'] = f"{root_num}.{reg_id+1} {self.get_inst_name(reg)}"
+        registers_strg['Desc1'] = self.get_name(reg)
+        registers_strg['Desc2'] = self.get_desc(reg)
+        registers_strg['Absolute_address'] = self.get_reg_absolute_address(reg)
+        registers_strg['Base_offset'] = self.get_reg_offset(reg)
+        registers_strg['Reset'] = self.get_reg_reset(reg)
+        registers_strg['Access'] = self.get_reg_access(reg)
+        registers_strg['Size'] = self.get_reg_size(reg)
+
+        # Reverse the fields order - MSB first
+        # reg.fields() only yields FieldNodes, so no isinstance filter
+        # is needed; the slice reverse is a single C-level copy
+        fields_list = list(reg.fields())[::-1]
+
+        field_rows = []
+        for field in fields_list:
+            field_rows.append(FieldRow(self.get_field_bits(field),
+                                       self.get_inst_name(field),
+                                       self.get_field_access(field),
+                                       self.get_field_reset(field),
+                                       self.get_name(field),
+                                       self.get_desc(field)))
+
+        return registers_strg, field_rows
+
     #####################################################################
     # Below methods are used for getting the required data from
     # the elaborated object
     #####################################################################
+    def _prop(self, node: Node, name: str, default=_MISS):
+        """
+        Memoized node.get_property() lookup
+
+        The same nodes are queried several times per export, so repeated
+        queries become dict hits instead of systemrdl property dispatches
+        """
+        key = (id(node), name)
+        entry = self._prop_cache.get(key, _MISS)
+        if entry is _MISS:
+            # Only forward the default when one was given, so the
+            # property's own default behaviour is preserved otherwise
+            if default is _MISS:
+                entry = (node, node.get_property(name))
+            else:
+                entry = (node, node.get_property(name, default=default))
+            self._prop_cache[key] = entry
+        return entry[1]
+
     def get_name(self, node: Node) -> str:
-        s = node.get_property("name")
+        s = self._prop(node, "name")
         return s
 
     def get_desc(self, node: Node) -> str:
-        s = (node.get_property("desc", default="")).replace("\n"," ")
-        s = s.replace("  "," ")
-        return s
+        # The None guard covers nodes whose desc is explicitly unset
+        s = self._prop(node, "desc", default="") or ""
+        s = s.translate(_DESC_TRANS)
+        return s.replace("  "," ")
 
     def get_addrmap_size(self, node: Node) -> str:
         # Get the hex value 
@@ -246,18 +573,33 @@ class PDFExporter:
         else:
             return node.inst_name.lower()
 
+    # Specialized get_inst_name implementations; export() binds the
+    # matching one to the instance so the per-node calls skip the
+    # use_uppercase_inst_name branch. The cased name is cached per node
+    # because each register name is requested twice for the list table
+    # alone
+    def _inst_name_upper(self, node: Node) -> str:
+        entry = self._name_cache.get(id(node))
+        if entry is None:
+            entry = (node, node.inst_name.upper())
+            self._name_cache[id(node)] = entry
+        return entry[1]
+
+    def _inst_name_lower(self, node: Node) -> str:
+        entry = self._name_cache.get(id(node))
+        if entry is None:
+            entry = (node, node.inst_name.lower())
+            self._name_cache[id(node)] = entry
+        return entry[1]
+
     def is_field_reserved(self, field: FieldNode) -> bool:
         """
         Returns True if the field is reserved
         """
 
-        # Check if the field is reserved type 
-        is_field_rsvd = re.search("reserved",field.inst_name, re.IGNORECASE)
-
-        if is_field_rsvd:
-            return True
-        else:
-            return False
+        # Check if the field is reserved type
+        # Plain substring scan - much cheaper than entering the regex engine
+        return "reserved" in field.inst_name.lower()
 
     def get_inst_map_name(self, node: Node) -> str:
         """
@@ -267,13 +609,16 @@ class PDFExporter:
         # Default value
         amap_name = "reg_map";
 
+        if node.owning_addrmap is self._current_amap:
+            return self._amap_map_name
+
         # Check if the udp is defined
         is_defined = self.check_udp("map_name_p", node)
-        
+
         if not is_defined:
             return amap_name
-   
-        # Get the upd value 
+
+        # Get the upd value
         amap = node.owning_addrmap
         amap_name = amap.get_property("map_name_p", default=amap_name);
 
@@ -295,67 +640,21 @@ class PDFExporter:
         """
         Get field's UVM access string
         """
-        sw = field.get_property("sw")
-        onread = field.get_property("onread")
-        onwrite = field.get_property("onwrite")
+        sw = self._prop(field, "sw")
+        onread = self._prop(field, "onread")
+        onwrite = self._prop(field, "onwrite")
 
         if sw == AccessType.rw:
-            if (onwrite is None) and (onread is None):
-                return "RW"
-            elif (onread == OnReadType.rclr) and (onwrite == OnWriteType.woset):
-                return "W1SRC"
-            elif (onread == OnReadType.rclr) and (onwrite == OnWriteType.wzs):
-                return "W0SRC"
-            elif (onread == OnReadType.rclr) and (onwrite == OnWriteType.wset):
-                return "WSRC"
-            elif (onread == OnReadType.rset) and (onwrite == OnWriteType.woclr):
-                return "W1CRS"
-            elif (onread == OnReadType.rset) and (onwrite == OnWriteType.wzc):
-                return "W0CRS"
-            elif (onread == OnReadType.rset) and (onwrite == OnWriteType.wclr):
-                return "WCRS"
-            elif onwrite == OnWriteType.woclr:
-                return "RW1C"
-            elif onwrite == OnWriteType.woset:
-                return "RW1S"
-            elif onwrite == OnWriteType.wot:
-                return "RW1T"
-            elif onwrite == OnWriteType.wzc:
-                return "RW0C"
-            elif onwrite == OnWriteType.wzs:
-                return "RW0S"
-            elif onwrite == OnWriteType.wzt:
-                return "RW0T"
-            elif onwrite == OnWriteType.wclr:
-                return "RWC"
-            elif onwrite == OnWriteType.wset:
-                return "RWS"
-            elif onread == OnReadType.rclr:
-                return "WRC"
-            elif onread == OnReadType.rset:
-                return "WRS"
-            else:
-                return "RW"
+            return (_FIELD_ACCESS_MAP.get((sw, onread, onwrite))
+                    or _FIELD_ACCESS_RW_ONWRITE.get(onwrite)
+                    or _FIELD_ACCESS_RW_ONREAD.get(onread)
+                    or "RW")
 
         elif sw == AccessType.r:
-            if onread is None:
-                return "RO"
-            elif onread == OnReadType.rclr:
-                return "RC"
-            elif onread == OnReadType.rset:
-                return "RS"
-            else:
-                return "RO"
+            return _FIELD_ACCESS_R_ONREAD.get(onread) or "RO"
 
         elif sw == AccessType.w:
-            if onwrite is None:
-                return "WO"
-            elif onwrite == OnWriteType.wclr:
-                return "WOC"
-            elif onwrite == OnWriteType.wset:
-                return "WOS"
-            else:
-                return "WO"
+            return _FIELD_ACCESS_W_ONWRITE.get(onwrite) or "WO"
 
         elif sw == AccessType.rw1:
             return "W1"
@@ -372,28 +671,14 @@ class PDFExporter:
         Get the field reset value
         """
 
-        # Get the value 
-        field_reset = field.get_property('reset',default=0) 
+        # Get the value
+        field_reset = self._prop(field, 'reset', default=0)
 
-        # Format the value
+        # Format the value to have underscore in hex value
         field_width = field.width
-        no_of_nib = field_width/4
+        final_value = _hex_fmt(field_width).format(field_reset)
 
-        # 64bit data
-        if no_of_nib == 16:
-            format_number = no_of_nib + 3
-        # 32bit data
-        elif no_of_nib == 8:
-            format_number = no_of_nib + 1
-        #  16bit or 8bit data     
-        else:
-            format_number = no_of_nib 
-
-        # format the string to have underscore in hex value
-        format_str = '{:0' + str(int(format_number)) + '_x}'
-        final_value = (format_str.format(field_reset))
-
-        return (str(field_width) +"'h"+ final_value.upper())
+        return f"{field_width}'h{final_value}"
 
 
     def get_mem_access(self, mem: MemNode) -> str:
@@ -429,7 +714,7 @@ class PDFExporter:
             return regaccess
    
         # Get the upd value 
-        regaccess = node.get_property("regaccess_p", default=regaccess)
+        regaccess = self._prop(node, "regaccess_p", default=regaccess)
 
         return regaccess
 
@@ -439,35 +724,33 @@ class PDFExporter:
         to form the register value
         """
 
-        reg_reset = 0;
-        
-        # Deduce the reset value
-        for field in node.fields():
-            if isinstance(field, FieldNode):
-                field_reset = field.get_property('reset',default=0) 
-                field_lsb_pos = field.lsb
-                reg_reset |= field_reset << field_lsb_pos
-        
+        key = id(node)
+        entry = self._reg_reset_cache.get(key)
+        if entry is None:
+            # Prefer a reset composed at the register level if the model
+            # provides one
+            reg_reset = self._prop(node, 'reset', default=None)
 
-        # Format the value
-        register_width = node.get_property('regwidth')
-        no_of_nib = register_width/4
+            if reg_reset is None:
+                # Deduce the reset value from the fields
+                # node.fields() only yields FieldNodes, and the property
+                # lookup is the hot cost, so keep the loop to one cached
+                # lookup and one shift per field
+                reg_reset = 0
+                for field in node.fields():
+                    reg_reset |= (self._prop(field, 'reset', default=0) or 0) << field.lsb
 
-        # 64bit data
-        if no_of_nib == 16:
-            format_number = no_of_nib + 3
-        # 32bit data
-        elif no_of_nib == 8:
-            format_number = no_of_nib + 1
-        #  16bit or 8bit data     
-        else:
-            format_number = no_of_nib 
+            entry = (node, reg_reset)
+            self._reg_reset_cache[key] = entry
+
+        reg_reset = entry[1]
 
-        # format the string to have underscore in hex value
-        format_str = '{:0' + str(int(format_number)) + '_x}'
-        final_value = (format_str.format(reg_reset))
 
-        return (str(register_width) +"'h"+ final_value.upper())
+        # Format the value to have underscore in hex value
+        register_width = self._prop(node, 'regwidth')
+        final_value = _hex_fmt(register_width).format(reg_reset)
+
+        return f"{register_width}'h{final_value}"
 
     def get_reg_size(self, node: RegNode) -> str:
         """
@@ -481,12 +764,15 @@ class PDFExporter:
         Checks if the property name is a udp
         """
 
-        prop_ups = node.list_properties(include_native=False, include_udp=True)
+        # list_properties walks the full UDP list, so resolve it once
+        # per node and keep the names as a frozenset for O(1) membership
+        key = id(node)
+        entry = self._udp_cache.get(key)
+        if entry is None:
+            entry = (node, frozenset(node.list_properties(include_native=False, include_udp=True)))
+            self._udp_cache[key] = entry
 
-        if prop_name in prop_ups:
-            return True
-        else:
-            return False
+        return prop_name in entry[1]
 
     def get_address_width(self, node: Node) -> str:
         """
@@ -498,55 +784,50 @@ class PDFExporter:
 
         amap = node.owning_addrmap
 
+        if amap is self._current_amap:
+            return self._amap_address_width
+
         # Check if the udp is defined
         is_defined = self.check_udp("address_width_p", node)
-        
+
         if not is_defined:
             return address_width
-   
-        # Get the upd value 
-        address_width = amap.get_property("address_width_p", default=address_width);
-    
-        return (int(address_width)) 
+
+        # Get the upd value
+        address_width = self._prop(amap, "address_width_p", default=address_width);
+
+        return (int(address_width))
 
     def get_base_address(self, node: Node) -> str:
         """
         Returns the base address for the register block 
         """
        
-        # Default value 
+        # Default value
         base_address = 0x0
 
         # Get the property value
         amap = node.owning_addrmap
 
+        if amap is self._current_amap:
+            return self._amap_base_address_str
+
         # Check if the udp is defined
         is_defined = self.check_udp("base_address_p", node)
-        
+
         if not is_defined:
-            return (self.format_address(base_address)) 
+            return (self.format_address(base_address))
 
         # Get the value
-        base_address = amap.get_property("base_address_p", default=base_address);
+        base_address = self._prop(amap, "base_address_p", default=base_address);
 
-        return (self.format_address(base_address)) 
+        return (self.format_address(base_address))
 
     def format_address(self, address: str) -> str:
 
-        no_of_nib = self.address_width/4
-
-        # 64bit address
-        if no_of_nib == 16:
-            format_number = no_of_nib + 3
-        # 32bit address     
-        else:
-            format_number = no_of_nib +1
-
-        # format the string to have underscore in hex value
-        format_str = '{:0' + str(int(format_number)) + '_x}'
-        final_value = (format_str.format(address))
-
-        return (str(self.address_width) +"'h"+ final_value.upper())
+        # format the string to have underscore in hex value, using the
+        # formatter bound by set_address_width
+        return f"{self._addr_bits_str}'h{self._addr_fmt(address)}"
 
     def get_array_address_offset_expr(self, node: AddressableNode) -> str:
         """
@@ -556,21 +837,20 @@ class PDFExporter:
         results in:
             X + i0*B*C*D*Y + i1*C*D*Y + i2*D*Y + i3*Y
         """
-        s = "'h%x" % node.raw_address_offset
         if node.is_array:
-            for i in range(len(node.array_dimensions)):
-                m = node.array_stride
-                for j in range(i+1, len(node.array_dimensions)):
-                    m *= node.array_dimensions[j]
-                s += " + i%d*'h%x" % (i, m)
-        return s
+            return _array_offset_expr(node.raw_address_offset,
+                                      tuple(node.array_dimensions),
+                                      node.array_stride)
+        return "'h%x" % node.raw_address_offset
 
 
     def get_endianness(self, node: Node) -> str:
         amap = node.owning_addrmap
-        if amap.get_property("bigendian"):
+        if amap is self._current_amap:
+            return self._amap_endian
+        if self._prop(amap, "bigendian"):
             return "UVM_BIG_ENDIAN"
-        elif amap.get_property("littleendian"):
+        elif self._prop(amap, "littleendian"):
             return "UVM_LITTLE_ENDIAN"
         else:
             return "UVM_NO_ENDIAN"
@@ -582,17 +862,19 @@ class PDFExporter:
         """
         width = self.bus_width_db[node.get_path()]
 
-        # Divide by 8, rounded up
-        if width % 8:
-            return width // 8 + 1
-        else:
-            return width // 8
+        # Divide by 8, rounded up (single shift instead of a %/// pair)
+        return (width + 7) >> 3
 
 
     def roundup_to(self, x: int, n: int) -> int:
         """
         Round x up to the nearest n
         """
+        # Power-of-two n (the common case for bus widths) reduces to a
+        # branchless mask, avoiding the divmod
+        if n and (n & (n-1)) == 0:
+            return (x + n - 1) & -n
+
         if x % n:
             return (x//n + 1) * n
         else:
@@ -600,5 +882,8 @@ class PDFExporter:
 
 
     def roundup_pow2(self, x):
+        # bit_length() of x-1 handles all x >= 2; 0 and 1 round up to 1
+        if x <= 1:
+            return 1
         return 1<<(x-1).bit_length()
 
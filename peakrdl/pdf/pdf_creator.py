@@ -11,6 +11,8 @@ from reportlab.platypus.doctemplate import SimpleDocTemplate
 from reportlab.lib.units import cm
 from reportlab.pdfgen import canvas
 
+from typing import NamedTuple, Optional
+
 from ...examples import myFirstPage, myLaterPages
 
 from reportlab.rl_config import canvas_basefontname as _baseFontName, \
@@ -33,6 +35,32 @@ _baseFontNameB = tt2ps(_baseFontName,1,0)
 _baseFontNameI = tt2ps(_baseFontName,0,1)
 _baseFontNameBI = tt2ps(_baseFontName,1,1)
 
+# Tables beyond this many rows are emitted in slices; splitByRow cost
+# grows with the height of a single flowable, so bounding each table
+# keeps the layout time linear for very large register maps
+TABLE_CHUNK_ROWS = 512
+
+############################################################################
+# Row records for the bulk create_*_bulk() interfaces.
+# NamedTuples unpack exactly like the plain tuples they replace but
+# name the slots on both sides of the interface, without the per-row
+# dict overhead the original create_* methods carried
+############################################################################
+class RegRow(NamedTuple):
+    offset: str
+    identifier: str
+    # None marks a reserved row, which gets no link target
+    reg_id: Optional[str]
+    name: str
+
+class FieldRow(NamedTuple):
+    bits: str
+    identifier: str
+    access: str
+    reset: str
+    name: str
+    desc: str
+
 ############################################################################
 # Class for implementing the afterFlowable method
 # which is used for registering the TOC enteries
@@ -316,23 +344,91 @@ class PDFCreator:
                                       ])
 
     ############################################################################
-    # Used for dumping the registers table info into the pdf document 
+    # Create the register's list info for a whole batch of rows
+    ############################################################################
+    def create_reg_list_info_bulk(self, reg_rows: list):
+        """
+        Takes a list of RegRow records (or equivalent tuples) and
+        adds them to the registers table in a single call. A reg_id of
+        None marks a reserved row, which gets no link target
+        """
+
+        style = styleSheet["BodyTextP"]
+
+        # Build the whole batch locally and extend the table data once
+        rows = []
+        for offset, identifier, reg_id, name in reg_rows:
+            P_offset = Paragraph(offset, style)
+
+            # Identifier
+            if reg_id is None:
+                P_identifier = Paragraph(identifier, style)
+            else:
+                # <a href="#ID" color="blue"> Text </a>
+                link = '<a href="#%s" color="blue">' % (reg_id + name.replace(" ",""))
+                P_identifier = Paragraph((link + identifier + "</a>"), style)
+
+            P_name = Paragraph(name, style)
+
+            rows.append([P_offset, P_identifier, P_name])
+
+        table_data_reg_list.extend(rows)
+
+    ############################################################################
+    # Create the field's list info for a whole batch of rows
+    ############################################################################
+    def create_fields_list_info_bulk(self, field_rows: list):
+        """
+        Takes a list of FieldRow records (or equivalent tuples) and
+        adds them to the fields table in a single call
+        """
+
+        style = styleSheet["BodyTextP"]
+
+        # Build the whole batch in one comprehension and extend the
+        # table data once
+        table_data_field_list.extend(
+            [Paragraph(bits, style),
+             Paragraph(identifier, style),
+             Paragraph(access, style),
+             Paragraph(reset, style),
+             [Paragraph(name, style), Paragraph(desc, style)],
+             ]
+            for bits, identifier, access, reset, name, desc in field_rows)
+
+    ############################################################################
+    # Used for dumping the registers table info into the pdf document
     ############################################################################
     def dump_reg_list_info(self):
 
-        t=Table(table_data_reg_list,
-                colWidths=[120,120,200],
-                splitByRow=1,
-                repeatRows=1,
-                style=[
-                    ('GRID',(0,0),(-1,-1),0.5,doc_color),
-                    ('LINEABOVE',(0,1),(-1,1),1,colors.black),
-                    ('BACKGROUND',(0,0),(-1,0),colors.HexColor(0xD9D9D9))
-                    ])
-
-        elements.append(t)
+        style = [
+            ('GRID',(0,0),(-1,-1),0.5,doc_color),
+            ('LINEABOVE',(0,1),(-1,1),1,colors.black),
+            ('BACKGROUND',(0,0),(-1,0),colors.HexColor(0xD9D9D9))
+            ]
+
+        if len(table_data_reg_list) <= TABLE_CHUNK_ROWS + 1:
+            t=Table(table_data_reg_list,
+                    colWidths=[120,120,200],
+                    splitByRow=1,
+                    repeatRows=1,
+                    style=style)
+
+            elements.append(t)
+        else:
+            # Emit the table in bounded slices, each repeating the
+            # header row, so one huge map never becomes one huge flowable
+            header = table_data_reg_list[0]
+            for start in range(1, len(table_data_reg_list), TABLE_CHUNK_ROWS):
+                t=Table([header] + table_data_reg_list[start:start+TABLE_CHUNK_ROWS],
+                        colWidths=[120,120,200],
+                        splitByRow=1,
+                        repeatRows=1,
+                        style=style)
+
+                elements.append(t)
         #elements.append(Spacer(1, 1*inch))
-        
+
         # Page break
         elements.append(PageBreak())
 
@@ -341,19 +437,34 @@ class PDFCreator:
     ############################################################################
     def dump_field_list_info(self):
 
-        t=Table(table_data_field_list,
-                colWidths=[45,80,50,83,192],
-                splitByRow=1,
-                repeatRows=1,
-                style=[
-                    ('GRID',(0,0),(-1,-1),0.5,doc_color),
-                    ('LINEABOVE',(0,1),(-1,1),1,colors.black),
-                    ('BACKGROUND',(0,0),(-1,0),colors.HexColor(0xD9D9D9)),
-                    ('ALIGN',(0,0),(-1,-1),'LEFT'),
-                    ('VALIGN',(0,1),(-1,-1),'MIDDLE'),
-                    ])
-
-        elements.append(t)
+        style = [
+            ('GRID',(0,0),(-1,-1),0.5,doc_color),
+            ('LINEABOVE',(0,1),(-1,1),1,colors.black),
+            ('BACKGROUND',(0,0),(-1,0),colors.HexColor(0xD9D9D9)),
+            ('ALIGN',(0,0),(-1,-1),'LEFT'),
+            ('VALIGN',(0,1),(-1,-1),'MIDDLE'),
+            ]
+
+        if len(table_data_field_list) <= TABLE_CHUNK_ROWS + 1:
+            t=Table(table_data_field_list,
+                    colWidths=[45,80,50,83,192],
+                    splitByRow=1,
+                    repeatRows=1,
+                    style=style)
+
+            elements.append(t)
+        else:
+            # Emit the table in bounded slices, each repeating the
+            # header row, so one huge register never becomes one huge flowable
+            header = table_data_field_list[0]
+            for start in range(1, len(table_data_field_list), TABLE_CHUNK_ROWS):
+                t=Table([header] + table_data_field_list[start:start+TABLE_CHUNK_ROWS],
+                        colWidths=[45,80,50,83,192],
+                        splitByRow=1,
+                        repeatRows=1,
+                        style=style)
+
+                elements.append(t)
         #elements.append(Spacer(1, 1*inch))
 
         # Page break
@@ -1,5 +1,61 @@
 from systemrdl import RDLListener
 
+class AddrmapListener(RDLListener):
+    """
+    Collects the addrmap nodes of a tree in post order, and fills the
+    exporter's bus_width_db on the same walk, so the tree is traversed
+    once instead of once per concern.
+
+    Unlike filtering node.descendants(), the walker only dispatches on
+    the node types a listener handles, so registers/fields/signals are
+    not materialized just to be discarded.
+    """
+    def __init__(self, exporter=None):
+        self.exporter = exporter
+        self.addrmaps = []
+
+        # Max width in bits
+        self.max_width_stack = []
+
+    def enter_Addrmap(self, node):
+        self.enter_group(node)
+
+    def exit_Addrmap(self, node):
+        self.exit_group(node)
+
+        # Collect on exit so children come before their parents,
+        # matching descendants(in_post_order=True)
+        self.addrmaps.append(node)
+
+    def enter_Regfile(self, node):
+        self.enter_group(node)
+
+    def exit_Regfile(self, node):
+        self.exit_group(node)
+
+    def enter_Reg(self, node):
+        # Update max width in stack
+        self.max_width_stack[-1] = max(node.get_property("accesswidth"), self.max_width_stack[-1])
+
+    def enter_Mem(self, node):
+        # Update max width in stack
+        self.max_width_stack[-1] = max(node.get_property("memwidth"), self.max_width_stack[-1])
+
+
+    def enter_group(self, node): # pylint: disable=unused-argument
+        self.max_width_stack.append(0)
+
+    def exit_group(self, node):
+        max_width = self.max_width_stack.pop()
+
+        # Register this node in the bus_width_db
+        if self.exporter is not None:
+            self.exporter.bus_width_db[node.get_path()] = max_width
+
+        # Propagate max width to parent
+        if self.max_width_stack:
+            self.max_width_stack[-1] = max(max_width, self.max_width_stack[-1])
+
 class PreExportListener(RDLListener):
     def __init__(self, exporter):
         self.exporter = exporter